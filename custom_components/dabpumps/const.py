@@ -84,9 +84,9 @@ BINARY_SENSOR_VALUES_ON = ['1', 'active']
 BINARY_SENSOR_VALUES_OFF = ['0', 'disactive', 'inactive']
 BINARY_SENSOR_VALUES_ALL = BINARY_SENSOR_VALUES_ON + BINARY_SENSOR_VALUES_OFF
 
-SWITCH_VALUES_ON = ['1', 'Enable']
-SWITCH_VALUES_OFF = ['0', 'Disable']
-SWITCH_VALUES_ALL = SWITCH_VALUES_ON + SWITCH_VALUES_OFF
+SWITCH_VALUES_ON = frozenset(['1', 'Enable'])
+SWITCH_VALUES_OFF = frozenset(['0', 'Disable'])
+SWITCH_VALUES_ALL = SWITCH_VALUES_ON | SWITCH_VALUES_OFF
 
 
 DABPUMPS_SSO_URL = "https://dabsso.dabpumps.com"
@@ -3,6 +3,8 @@ import async_timeout
 import json
 import logging
 import re
+import sys
+import time
 
 from collections import namedtuple
 from datetime import datetime, timedelta, timezone
@@ -168,12 +170,27 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
 
         self._api.set_diagnostics(self._diag_api_handler)
 
+        # Entities waiting for a batched state write after a data update
+        self._pending_writes = set()
+
+        # Object_ids whose status value changed during the latest data fetch,
+        # plus the success state of the last listener notification
+        self._changed_keys = set()
+        self._last_notify_success = True
+
+        # Shared cache of translated params.values lookups, so entities from
+        # devices that share a device config reuse one dict
+        self._values_lookup_cache = {}
+
         # Persisted cached data in case communication to DAB Pumps fails
         self._hass = hass
         self._store_key = install_id
         self._store = DabPumpsCoordinatorStore(hass, self._store_key)
         self._cache = None
-        self._cache_last_write = datetime.min
+        # Throttle for cache writes; monotonic clock avoids datetime/timedelta
+        # allocations on every update cycle. Start one full period in the
+        # past so the first cycle always persists, regardless of host uptime.
+        self._cache_last_write = -COORDINATOR_CACHE_WRITE_PERIOD
 
 
     @property
@@ -181,6 +198,22 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
         return self._string_map
 
 
+    @property
+    def values_lookup_cache(self):
+        """Cache of translated params.values lookups, shared between entities"""
+        return self._values_lookup_cache
+
+    @property
+    def changed_keys(self):
+        """Set of object_ids whose status value changed in the latest update"""
+        return self._changed_keys
+
+    @property
+    def status_map(self):
+        # Direct access for entities; avoids unpacking the full data tuple per update
+        return self._status_map
+
+
     @property
     def user_role(self):
         return self._user_role[0] # only use the first character
@@ -225,6 +258,9 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
         """
         _LOGGER.debug(f"Update data")
 
+        # Start collecting which statusses change during this fetch
+        self._changed_keys = set()
+
         # Make sure our cache is available
         if self._cache is None:
             if self._store:
@@ -239,13 +275,14 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
         await self._async_detect_data()
 
         # Periodically persist the cache
+        now = time.monotonic()
         if self._hass and \
            self._store and \
            self._cache and \
-           (datetime.now() - self._cache_last_write).total_seconds() > COORDINATOR_CACHE_WRITE_PERIOD:
+           now - self._cache_last_write > COORDINATOR_CACHE_WRITE_PERIOD:
             
             _LOGGER.debug(f"Persist cache")
-            self._cache_last_write = datetime.now()
+            self._cache_last_write = now
 
             store = await self._store.async_get_data() or {}
             store["cache"] = self._cache
@@ -257,6 +294,62 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
         return (self._device_map, self._config_map, self._status_map)
     
     
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Notify only the listeners whose status changed in the latest update.
+
+        Entities register with their object_id as listener context, so a
+        refresh costs O(changed statusses) instead of waking every entity.
+        Listeners without a context are always notified.
+        """
+        # On a failed refresh, or on any success<->failure transition, fall
+        # back to notifying everyone so entities re-render their availability
+        success = self.last_update_success
+        if not success or success != self._last_notify_success:
+            self._last_notify_success = success
+            super().async_update_listeners()
+            return
+
+        # Note: this iterates DataUpdateCoordinator's internal _listeners
+        # mapping of remove-callback to (update_callback, context) tuples;
+        # revisit if a Home Assistant release changes its shape
+        changed = self._changed_keys
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+
+    @callback
+    def async_schedule_write(self, entity):
+        """
+        Collect an entity whose attributes changed during a coordinator update.
+
+        Instead of each entity writing its state individually, the writes are
+        batched and flushed in one event-loop callback. This reduces event-loop
+        wakeups when one poll updates many entities at once.
+        """
+        self._pending_writes.add(entity)
+        if len(self._pending_writes) == 1:
+            self.hass.loop.call_soon(self._async_flush_writes)
+
+
+    @callback
+    def _async_flush_writes(self):
+        """Write the state of all entities collected since the last flush"""
+        pending = self._pending_writes
+        self._pending_writes = set()
+
+        for entity in pending:
+            # Skip entities that were removed between scheduling and the flush
+            if entity.hass is None:
+                continue
+            try:
+                entity.async_write_ha_state()
+            except Exception as ex:
+                _LOGGER.warning(f"Could not write state for {entity.entity_id}. Details: {ex}")
+
+
     async def async_modify_data(self, object_id, value):
         """
         Set an entity param via the API.
@@ -275,6 +368,7 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
         # update the cached value in status_map
         status = status._replace(val=value)
         self._status_map[object_id] = status
+        self._changed_keys.add(object_id)
         
         # update the remote value
         return await self._async_change_device_status(status, value)
@@ -839,6 +933,14 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
         
         _LOGGER.debug(f"DAB Pumps statusses found for '{device.name}' with {len(status_map)} values")
 
+        # Track which statusses actually changed value, so entities can
+        # skip their update entirely when theirs did not
+        old_map = self._status_map
+        self._changed_keys.update(
+            k for k, v in status_map.items()
+            if (old := old_map.get(k)) is None or old.val != v.val
+        )
+
         # Merge with statusses from other devices
         self._status_map_ts = datetime.now()
         self._status_map.update(status_map)
@@ -850,7 +952,7 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
         """
         language = data.get('bundle', DEFAULT_LANGUAGE)
         messages = data.get('messages', {})
-        string_map = { k: v for k, v in messages.items() }
+        string_map = dict(messages)
         
         # Sanity check. # Never overwrite a known string_map with empty lists
         if len(string_map) == 0:
@@ -987,7 +1089,10 @@ class DabPumpsCoordinator(DataUpdateCoordinator):
         str = '_'.join(args).strip('_')
         str = re.sub(' ', '_', str)
         str = re.sub('[^a-z0-9_-]+', '', str.lower())
-        return str        
+
+        # Intern the id; these strings are used as status_map keys and entity
+        # ids, so interning makes the per-update dict lookups pointer-compares
+        return sys.intern(str)
 
 
 class DabPumpsDataError(Exception):
@@ -2,7 +2,6 @@
 
 import logging
 
-from copy import deepcopy
 from typing import Any
 
 from homeassistant.components.diagnostics import REDACTED
@@ -33,6 +33,7 @@ import logging
 import async_timeout
 
 from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.number import NumberDeviceClass
@@ -73,6 +74,187 @@ from .coordinator import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lookup sets for get_entity_category, built once at import.
+# The category for an entity only depends on its immutable params,
+# so get_entity_category is evaluated once per entity at creation.
+#
+# Groups we always want as sensors even if they would fail the tests below
+CATEGORY_GROUPS_NONE = frozenset(['I/O'])
+# Groups associated with Control; entities are added under 'Controls'
+CATEGORY_GROUPS_CONTROL = frozenset(['Extra Comfort'])
+# Groups associated with configuration; entities are added under 'Configuration'
+CATEGORY_GROUPS_CONFIG = frozenset(['System Management', 'Setpoint'])
+# Groups associated with diagnostics
+CATEGORY_GROUPS_DIAG = frozenset([
+    'Debug', 
+    'Errors',
+    'Extra Comfort', 
+    'Firmware Updates', 
+    'I/O', 
+    'Installer', 
+    'Modbus', 
+    'ModbusDevice', 
+    'PLC', 
+    'System Management',
+    'Technical Assistance',
+    'Version',
+])
+# Specific entries associated with others that are DIAGNOSTIC
+CATEGORY_KEYS_DIAG = frozenset([
+    'LastErrorOccurrency',
+    'LastErrorTimePowerOn',
+])
+
+# Lookup sets for get_sensor_state_class, built once at import.
+#
+# Diagnostics kind of groups that get StateClass=None
+STATE_CLASS_GROUPS_NONE = frozenset(['Modbus', 'Extra Comfort'])
+# Specific fields that get StateClass=None
+STATE_CLASS_KEYS_NONE = frozenset([
+    'Last_Period_Flow_Counter',
+    'Last_Period_Flow_Counter_Gall',
+    'Last_Period_Energy_Counter',
+    'Fluid_Remain',
+    'Fluid_Remain_inch',
+])
+# Fields that get StateClass=TOTAL
+STATE_CLASS_KEYS_TOTAL = frozenset([])
+# Fields that get StateClass=TOTAL_INCREASING
+STATE_CLASS_KEYS_TOTAL_INCREASING = frozenset([
+    'Actual_Period_Flow_Counter',
+    'Actual_Period_Flow_Counter_Gall',
+    'Actual_Period_Energy_Counter',
+    'FCp_Partial_Delivered_Flow_Gall',
+    'FCp_Partial_Delivered_Flow_mc',
+    'FCt_Total_Delivered_Flow_Gall',
+    'FCt_Total_Delivered_Flow_mc',
+    'HO_PowerOnHours',
+    'HO_PumpRunHours',
+    'PartialEnergy',
+    'SO_PowerOnSeconds',
+    'SO_PumpRunSeconds',
+    'StartNumber',
+    'TotalEnergy',
+    'UpTime',
+    'WlanRx',
+    'WlanTx',
+])
+
+
+# The unit to icon and unit to device-class mappings are pure functions of
+# the unit string. Cache them at module level so each match statement runs
+# once per unique unit instead of once per created entity.
+
+@lru_cache(maxsize=None)
+def _icon_for_unit(unit):
+    """Convert from HA unit to icon"""
+    # Most fields have no unit at all; skip the match for those
+    if unit is None:
+        return None
+
+    match unit:
+        case '°C':      return 'mdi:thermometer'
+        case '°F':      return 'mdi:thermometer'
+        case 'bar':     return 'mdi:water-pump'
+        case 'psi':     return 'mdi:water-pump'
+        case 'm³':      return 'mdi:water'
+        case 'L':       return 'mdi:water'
+        case 'gal':     return 'mdi:water'
+        case 'L/min':   return 'mdi:hydro-power'
+        case 'gal/min': return 'mdi:hydro-power'
+        case 'mm':      return 'mdi:waves-arrow-up'
+        case 'cm':      return 'mdi:waves-arrow-up'
+        case 'in':      return 'mdi:waves-arrow-up'
+        case 's':       return 'mdi:timer-sand'
+        case 'min':     return 'mdi:timer-sand'
+        case 'h':       return 'mdi:timer'
+        case 'B':       return 'mdi:memory'
+        case 'kB':      return 'mdi:memory'
+        case 'MB':      return 'mdi:memory'
+        case 'kB/s':    return 'mdi:memory-arrow-down'
+        case '%':       return 'mdi:percent'
+        case 'A':       return 'mdi:lightning-bolt'
+        case 'V':       return 'mdi:lightning-bolt'
+        case 'W':       return 'mdi:power-plug'
+        case 'kW':      return 'mdi:power-plug'
+        case 'Wh':      return 'mdi:lightning'
+        case 'kWh':     return 'mdi:lightning'
+        case _:         return None
+
+
+@lru_cache(maxsize=None)
+def _number_device_class_for_unit(unit):
+    """Convert from HA unit to NumberDeviceClass"""
+    if unit is None:
+        return None
+
+    match unit:
+        case '°C':      return NumberDeviceClass.TEMPERATURE
+        case '°F':      return NumberDeviceClass.TEMPERATURE
+        case 'bar':     return NumberDeviceClass.PRESSURE
+        case 'psi':     return NumberDeviceClass.PRESSURE
+        case 'm³':      return NumberDeviceClass.WATER
+        case 'L':       return NumberDeviceClass.WATER
+        case 'gal':     return NumberDeviceClass.WATER
+        case 'l/m':     return NumberDeviceClass.VOLUME_FLOW_RATE
+        case 'gal/m':   return NumberDeviceClass.VOLUME_FLOW_RATE
+        case 'mm':      return NumberDeviceClass.DISTANCE
+        case 'cm':      return NumberDeviceClass.DISTANCE
+        case 'in':      return NumberDeviceClass.DISTANCE
+        case 's':       return NumberDeviceClass.DURATION
+        case 'min':     return None
+        case 'h':       return None
+        case 'rpm':     return None
+        case 'B':       return NumberDeviceClass.DATA_SIZE
+        case 'kB':      return NumberDeviceClass.DATA_SIZE
+        case 'MB':      return NumberDeviceClass.DATA_SIZE
+        case 'kB/s':    return NumberDeviceClass.DATA_RATE
+        case '%':       return NumberDeviceClass.POWER_FACTOR
+        case 'A':       return NumberDeviceClass.CURRENT
+        case 'V':       return NumberDeviceClass.VOLTAGE
+        case 'W':       return NumberDeviceClass.POWER
+        case 'kW':      return NumberDeviceClass.POWER
+        case 'Wh':      return NumberDeviceClass.ENERGY
+        case 'kWh':     return NumberDeviceClass.ENERGY
+        case _:         return None
+
+
+@lru_cache(maxsize=None)
+def _sensor_device_class_for_unit(unit):
+    """Convert from HA unit to SensorDeviceClass"""
+    if unit is None:
+        return None
+
+    match unit:
+        case '°C':      return SensorDeviceClass.TEMPERATURE
+        case '°F':      return SensorDeviceClass.TEMPERATURE
+        case 'bar':     return SensorDeviceClass.PRESSURE
+        case 'psi':     return SensorDeviceClass.PRESSURE
+        case 'm³':      return SensorDeviceClass.WATER
+        case 'L':       return SensorDeviceClass.WATER
+        case 'gal':     return SensorDeviceClass.WATER
+        case 'l/min':   return SensorDeviceClass.VOLUME_FLOW_RATE
+        case 'gal/min': return SensorDeviceClass.VOLUME_FLOW_RATE
+        case 'mm':      return SensorDeviceClass.DISTANCE
+        case 'cm':      return SensorDeviceClass.DISTANCE
+        case 'in':      return SensorDeviceClass.DISTANCE
+        case 's':       return SensorDeviceClass.DURATION
+        case 'min':     return None
+        case 'h':       return None
+        case 'rpm':     return None
+        case 'B':       return SensorDeviceClass.DATA_SIZE
+        case 'kB':      return SensorDeviceClass.DATA_SIZE
+        case 'MB':      return SensorDeviceClass.DATA_SIZE
+        case 'kB/s':    return SensorDeviceClass.DATA_RATE
+        case '%':       return SensorDeviceClass.POWER_FACTOR
+        case 'A':       return SensorDeviceClass.CURRENT
+        case 'V':       return SensorDeviceClass.VOLTAGE
+        case 'W':       return SensorDeviceClass.POWER
+        case 'kW':      return SensorDeviceClass.POWER
+        case 'Wh':      return SensorDeviceClass.ENERGY
+        case 'kWh':     return SensorDeviceClass.ENERGY
+        case _:         return None
+
 
 class DabPumpsEntityHelperFactory:
     
@@ -144,12 +326,12 @@ class DabPumpsEntityHelper:
             if not config:
                 continue
             
-            if not config.meta_params or status.key not in config.meta_params:
+            # Single dict lookup instead of a membership test followed by a subscript
+            params = config.meta_params.get(status.key) if config.meta_params else None
+            if params is None:
                 _LOGGER.warning(f"Device metadata holds no info to create a sensor for '{status.key}' with value '{status.val}'.")
                 continue
             
-            params = config.meta_params[status.key]
-            
             if not self._is_entity_whitelisted(params):
                 # Some statusses (error1...error64) are deliberately skipped
                 continue
@@ -191,23 +373,23 @@ class DabPumpsEntityHelper:
         """
         
         # Whitelisted keys that would otherwise be excluded by blacklisted groups below:
-        keys_whitelist = [
+        keys_whitelist = (
             'RamUsed',      # group: Debug
             'RamUsedMax',   # group: Debug
             'PumpDisable',  # group: System Management
             'LatestError'   # group: Errors
-        ]
+        )
 
         # Blacklisted keys that would otherwise be included by whitelisted groups below:
-        keys_blacklist = []
+        keys_blacklist = ()
         
-        groups_whitelist = []
-        groups_blacklist = [
+        groups_whitelist = ()
+        groups_blacklist = (
             'Debug',
             'System Management',
             'ModbusDevice',
             'Errors'
-        ]
+        )
 
         # First check if entity is allowed to be viewed according to user_role
         if self.coordinator.user_role not in params.view:
@@ -242,13 +424,13 @@ class DabPumpsEntityHelper:
         # Needs to have change rights the user role
         # And needs to be in group 'Extra Comfort' or be a specific key
         # that would otherwise be excluded as group
-        keys_config = [
+        keys_config = (
             'PumpDisable',
-        ]
-        groups_config = [
+        )
+        groups_config = (
             'Extra Comfort',
             'Setpoint',
-        ]
+        )
         is_config = False
         if self.coordinator.user_role in params.change:
             if params.key in keys_config:
@@ -296,6 +478,23 @@ class DabPumpsEntity(Entity):
         return self._coordinator.string_map.get(str, str)
 
 
+    def _get_values_lookup(self):
+        """
+        Return the translated params.values dict for this entity.
+
+        Cached on the coordinator, so entities from devices that share the
+        same device config reuse one dict instead of each building a copy.
+        """
+        params = self._params
+        cache_key = (params.key, tuple(params.values.items()))
+
+        lookup = self._coordinator.values_lookup_cache.get(cache_key)
+        if lookup is None:
+            lookup = { k: self._get_string(v) for k,v in params.values.items() }
+            self._coordinator.values_lookup_cache[cache_key] = lookup
+        return lookup
+
+
     def _convert_to_unit(self):
         """Convert from DAB Pumps units to Home Assistant units"""
         match self._params.unit:
@@ -343,158 +542,48 @@ class DabPumpsEntity(Entity):
     
     def get_icon(self):
         """Convert from HA unit to icon"""
-        match self._attr_unit:
-            case '°C':      return 'mdi:thermometer'
-            case '°F':      return 'mdi:thermometer'
-            case 'bar':     return 'mdi:water-pump'
-            case 'psi':     return 'mdi:water-pump'
-            case 'm³':      return 'mdi:water'
-            case 'L':       return 'mdi:water'
-            case 'gal':     return 'mdi:water'
-            case 'L/min':   return 'mdi:hydro-power'
-            case 'gal/min': return 'mdi:hydro-power'
-            case 'mm':      return 'mdi:waves-arrow-up'
-            case 'cm':      return 'mdi:waves-arrow-up'
-            case 'in':      return 'mdi:waves-arrow-up'
-            case 's':       return 'mdi:timer-sand'
-            case 'min':     return 'mdi:timer-sand'
-            case 'h':       return 'mdi:timer'
-            case 'B':       return 'mdi:memory'
-            case 'kB':      return 'mdi:memory'
-            case 'MB':      return 'mdi:memory'
-            case 'kB/s':    return 'mdi:memory-arrow-down'
-            case '%':       return 'mdi:percent'
-            case 'A':       return 'mdi:lightning-bolt'
-            case 'V':       return 'mdi:lightning-bolt'
-            case 'W':       return 'mdi:power-plug'
-            case 'kW':      return 'mdi:power-plug'
-            case 'Wh':      return 'mdi:lightning'
-            case 'kWh':     return 'mdi:lightning'
-            case _:         return None
+        return _icon_for_unit(self._attr_unit)
     
     
     def get_number_device_class(self):
         """Convert from HA unit to NumberDeviceClass"""
         if self._params.type == 'enum':
             return NumberDeviceClass.ENUM
-            
-        match self._attr_unit:
-            case '°C':      return NumberDeviceClass.TEMPERATURE
-            case '°F':      return NumberDeviceClass.TEMPERATURE
-            case 'bar':     return NumberDeviceClass.PRESSURE
-            case 'psi':     return NumberDeviceClass.PRESSURE
-            case 'm³':      return NumberDeviceClass.WATER
-            case 'L':       return NumberDeviceClass.WATER
-            case 'gal':     return NumberDeviceClass.WATER
-            case 'l/m':     return NumberDeviceClass.VOLUME_FLOW_RATE
-            case 'gal/m':   return NumberDeviceClass.VOLUME_FLOW_RATE
-            case 'mm':      return NumberDeviceClass.DISTANCE
-            case 'cm':      return NumberDeviceClass.DISTANCE
-            case 'in':      return NumberDeviceClass.DISTANCE
-            case 's':       return NumberDeviceClass.DURATION
-            case 'min':     return None
-            case 'h':       return None
-            case 'rpm':     return None
-            case 'B':       return NumberDeviceClass.DATA_SIZE
-            case 'kB':      return NumberDeviceClass.DATA_SIZE
-            case 'MB':      return NumberDeviceClass.DATA_SIZE
-            case 'kB/s':    return NumberDeviceClass.DATA_RATE
-            case '%':       return NumberDeviceClass.POWER_FACTOR
-            case 'A':       return NumberDeviceClass.CURRENT
-            case 'V':       return NumberDeviceClass.VOLTAGE
-            case 'W':       return NumberDeviceClass.POWER
-            case 'kW':      return NumberDeviceClass.POWER
-            case 'Wh':      return NumberDeviceClass.ENERGY
-            case 'kWh':     return NumberDeviceClass.ENERGY
-            case _:         return None
+
+        return _number_device_class_for_unit(self._attr_unit)
     
     
     def get_sensor_device_class(self):
         """Convert from HA unit to SensorDeviceClass"""
         if self._params.type == 'enum':
             return SensorDeviceClass.ENUM
-            
-        match self._attr_unit:
-            case '°C':      return SensorDeviceClass.TEMPERATURE
-            case '°F':      return SensorDeviceClass.TEMPERATURE
-            case 'bar':     return SensorDeviceClass.PRESSURE
-            case 'psi':     return SensorDeviceClass.PRESSURE
-            case 'm³':      return SensorDeviceClass.WATER
-            case 'L':       return SensorDeviceClass.WATER
-            case 'gal':     return SensorDeviceClass.WATER
-            case 'l/min':   return SensorDeviceClass.VOLUME_FLOW_RATE
-            case 'gal/min': return SensorDeviceClass.VOLUME_FLOW_RATE
-            case 'mm':      return SensorDeviceClass.DISTANCE
-            case 'cm':      return SensorDeviceClass.DISTANCE
-            case 'in':      return SensorDeviceClass.DISTANCE
-            case 's':       return SensorDeviceClass.DURATION
-            case 'min':     return None
-            case 'h':       return None
-            case 'rpm':     return None
-            case 'B':       return SensorDeviceClass.DATA_SIZE
-            case 'kB':      return SensorDeviceClass.DATA_SIZE
-            case 'MB':      return SensorDeviceClass.DATA_SIZE
-            case 'kB/s':    return SensorDeviceClass.DATA_RATE
-            case '%':       return SensorDeviceClass.POWER_FACTOR
-            case 'A':       return SensorDeviceClass.CURRENT
-            case 'V':       return SensorDeviceClass.VOLTAGE
-            case 'W':       return SensorDeviceClass.POWER
-            case 'kW':      return SensorDeviceClass.POWER
-            case 'Wh':      return SensorDeviceClass.ENERGY
-            case 'kWh':     return SensorDeviceClass.ENERGY
-            case _:         return None
+
+        return _sensor_device_class_for_unit(self._attr_unit)
     
     
     def get_sensor_state_class(self):
+        params = self._params
+
         # Return StateClass=None for Enum or Label
-        if self._params.type != 'measure':
+        if params.type != 'measure':
             return None
-        
+
         # Return StateClass=None for params that are a setting, unlikely to change often
-        if self._params.change:
+        if params.change:
             return None
-        
+
         # Return StateClass=None for diagnostics kind of parameters
-        groups_none = ['Modbus', 'Extra Comfort']
-        if self._params.group in groups_none:
+        if params.group in STATE_CLASS_GROUPS_NONE:
             return None
-        
+
         # Return StateClass=None for some specific fields
-        keys_none = [
-            'Last_Period_Flow_Counter',
-            'Last_Period_Flow_Counter_Gall',
-            'Last_Period_Energy_Counter',
-            'Fluid_Remain',
-            'Fluid_Remain_inch',
-        ]
-        if self._params.key in keys_none:
+        if params.key in STATE_CLASS_KEYS_NONE:
             return None
             
-        keys_t = []
-        keys_ti = [
-            'Actual_Period_Flow_Counter',
-            'Actual_Period_Flow_Counter_Gall',
-            'Actual_Period_Energy_Counter',
-            'FCp_Partial_Delivered_Flow_Gall',
-            'FCp_Partial_Delivered_Flow_mc',
-            'FCt_Total_Delivered_Flow_Gall',
-            'FCt_Total_Delivered_Flow_mc',
-            'HO_PowerOnHours',
-            'HO_PumpRunHours',
-            'PartialEnergy',
-            'SO_PowerOnSeconds',
-            'SO_PumpRunSeconds',
-            'StartNumber',
-            'TotalEnergy',
-            'UpTime',
-            'WlanRx',
-            'WlanTx',
-        ]
-        
-        if self._params.key in keys_t:
+        if params.key in STATE_CLASS_KEYS_TOTAL:
             return SensorStateClass.TOTAL
-            
-        elif self._params.key in keys_ti:
+
+        elif params.key in STATE_CLASS_KEYS_TOTAL_INCREASING:
             return SensorStateClass.TOTAL_INCREASING
             
         else:
@@ -502,70 +591,41 @@ class DabPumpsEntity(Entity):
     
     
     def get_entity_category(self):
-        
+        params = self._params
+
         # Return None for some specific groups we always want as sensors 
         # even if they would fail some of the tests below
-        groups_none = [
-            'I/O', 
-        ]
-        if self._params.group in groups_none:
+        if params.group in CATEGORY_GROUPS_NONE:
             return None
             
         # Return None for params in groups associated with Control
         # and that a customer is allowed to change.
-        # Leads to the entities being added under 'Controls'
-        groups_control = [
-            'Extra Comfort',
-        ]
-        if self._params.group in groups_control and 'C' in self._params.change:
+        if params.group in CATEGORY_GROUPS_CONTROL and 'C' in params.change:
             return None
         
         # Return CONFIG for params in groups associated with configuration
-        # and that an installer is allowed to change
-        # Leads to the entities being added under 'Configuration'
+        # and that an installer is allowed to change.
         # Typically intended for restart or update functionality
-        groups_config = [
-            'System Management',
-            'Setpoint'
-        ]
-        if self._params.group in groups_config and 'I' in self._params.change:
+        if params.group in CATEGORY_GROUPS_CONFIG and 'I' in params.change:
             return EntityCategory.CONFIG
             
         # Return DIAGNOSTIC for params in groups associated with diagnostics
-        groups_diag = [
-            'Debug', 
-            'Errors',
-            'Extra Comfort', 
-            'Firmware Updates', 
-            'I/O', 
-            'Installer', 
-            'Modbus', 
-            'ModbusDevice', 
-            'PLC', 
-            'System Management',
-            'Technical Assistance',
-            'Version',
-        ]
-        if self._params.group in groups_diag:
+        if params.group in CATEGORY_GROUPS_DIAG:
             return EntityCategory.DIAGNOSTIC
             
         # Return DIAGNOSTIC for some specific entries associated with others that are DIAGNOSTIC
-        keys_diag = [
-            'LastErrorOccurrency',
-            'LastErrorTimePowerOn',
-        ]
-        if self._params.key in keys_diag:
+        if params.key in CATEGORY_KEYS_DIAG:
             return EntityCategory.DIAGNOSTIC
         
         # Return DIAGNOSTIC for params that are a setting, unlikely to change often
-        if self._params.change:
+        if params.change:
             return EntityCategory.DIAGNOSTIC
             
         # Return DIAGNOSTIC for params that are not visible for Customer or Installer (i.e. only visible for Service or R&D)
-        if 'C' not in self._params.view and 'I' not in self._params.view:
+        if 'C' not in params.view and 'I' not in params.view:
             return EntityCategory.DIAGNOSTIC
         
-        if 'C' not in self._params.view and self._params.family == 'gear':
+        if 'C' not in params.view and params.family == 'gear':
             return EntityCategory.DIAGNOSTIC
         
         # Return None for all others
@@ -575,13 +635,13 @@ class DabPumpsEntity(Entity):
     def get_number_step(self):
         match self._attr_unit:
             case 's':
-                candidates = [3600, 60, 1]
+                candidates = (3600, 60, 1)
             case 'min':
-                candidates = [60, 1]
+                candidates = (60, 1)
             case 'h':
-                candidates = [24, 1]
+                candidates = (24, 1)
             case _:
-                candidates = [1000, 100, 10, 1]
+                candidates = (1000, 100, 10, 1)
                 
         # find first candidate where min, max and diff are all dividable by (without remainder)
         if self._params.min is not None and self._params.max is not None:
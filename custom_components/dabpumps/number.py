@@ -65,7 +65,7 @@ class DabPumpsNumber(CoordinatorEntity, NumberEntity, DabPumpsEntity):
     
     def __init__(self, coordinator, install_id, object_id, device, params, status) -> None:
         """ Initialize the sensor. """
-        CoordinatorEntity.__init__(self, coordinator)
+        CoordinatorEntity.__init__(self, coordinator, context=object_id)
         DabPumpsEntity.__init__(self, coordinator, params)
         
         # The unique identifier for this sensor within Home Assistant
@@ -104,13 +104,12 @@ class DabPumpsNumber(CoordinatorEntity, NumberEntity, DabPumpsEntity):
         """Handle updated data from the coordinator."""
 
         # find the correct device and status corresponding to this sensor
-        (_, _, status_map) = self._coordinator.data
-        status = status_map.get(self.object_id)
+        status = self._coordinator.status_map.get(self.object_id)
 
         # Update any attributes
-        if status:
+        if status is not None:
             if self._update_attributes(status, False):
-                self.async_write_ha_state()
+                self._coordinator.async_schedule_write(self)
     
     
     def _update_attributes(self, status, is_create):
@@ -1,9 +1,7 @@
-import asyncio
 import logging
 import math
+import sys
 
-from homeassistant import config_entries
-from homeassistant import exceptions
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.sensor import SensorStateClass
@@ -13,22 +11,11 @@ from homeassistant.const import EntityCategory
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.core import callback
-from homeassistant.exceptions import HomeAssistantError
-from homeassistant.exceptions import IntegrationError
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity_registry import async_get
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.significant_change import check_percentage_change
 
-from datetime import timedelta
-from datetime import datetime
-
-from collections import defaultdict
-from collections import namedtuple
-
 
 from .const import (
     DOMAIN,
@@ -48,6 +35,9 @@ from .entity_base import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# State classes for which a non-significant decrease in value is ignored
+TOTAL_STATE_CLASSES = frozenset([SensorStateClass.TOTAL, SensorStateClass.TOTAL_INCREASING])
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     """
@@ -64,10 +54,10 @@ class DabPumpsSensor(CoordinatorEntity, SensorEntity, DabPumpsEntity):
     Could be a sensor that is part of a pump like ESybox, Esybox.mini
     Or could be part of a communication module like DConnect Box/Box2
     """
-    
+
     def __init__(self, coordinator, install_id, object_id, device, params, status) -> None:
         """ Initialize the sensor. """
-        CoordinatorEntity.__init__(self, coordinator)
+        CoordinatorEntity.__init__(self, coordinator, context=object_id)
         DabPumpsEntity.__init__(self, coordinator, params)
         
         # The unique identifier for this sensor within Home Assistant
@@ -75,12 +65,49 @@ class DabPumpsSensor(CoordinatorEntity, SensorEntity, DabPumpsEntity):
         self.entity_id = ENTITY_ID_FORMAT.format(status.unique_id)
         self.install_id = install_id
         
-        self._coordinator = coordinator
+        # Note: _coordinator and _params are already stored by DabPumpsEntity.__init__
         self._device = device
-        self._params = params
-        
+        self._last_raw_val = None
+
+        # Display precision only depends on the immutable params; compute it once
+        # instead of on every value update
+        if params.type == 'measure':
+            if params.weight and params.weight != 1 and params.weight != 0:
+                self._precision = int(math.floor(math.log10(1.0 / params.weight)))
+            else:
+                self._precision = 0
+        else:
+            self._precision = None
+
+        # For enum sensors, resolve the translated value lookup once;
+        # the same pattern as DabPumpsSelect uses for its options
+        if params.type == 'enum':
+            # Intern the translated values so identical strings are shared
+            # across entities and state comparisons can short-circuit on identity
+            self._enum_lookup = { k: sys.intern(self._get_string(v)) for k,v in params.values.items() }
+        else:
+            self._enum_lookup = None
+
+        # Bind the value transform for this sensor's type once, so updates
+        # do not re-dispatch on the (immutable) params type
+        match params.type:
+            case 'measure':
+                # Specialize on the (immutable) weight: most sensors have unity
+                # weight and only need an int conversion per update
+                if params.weight and params.weight != 1 and params.weight != 0:
+                    self._compute = self._compute_measure_float
+                else:
+                    self._compute = self._compute_measure_int
+            case 'enum':
+                self._compute = self._compute_enum
+            case 'label':
+                self._compute = self._compute_label
+            case _:
+                _LOGGER.warn(f"DAB Pumps encountered an unknown sensor type '{params.type}' for '{params.key}'. Please contact the integration developer to have this resolved.")
+                self._compute = self._compute_label
+
         # Create all attributes
-        self._update_attributes(status, True)
+        self._initial_attributes(status)
     
     
     @property
@@ -89,109 +116,112 @@ class DabPumpsSensor(CoordinatorEntity, SensorEntity, DabPumpsEntity):
         return self.object_id
     
     
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for use in home assistant."""
-        return self._attr_unique_id
-    
-    
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self._attr_name
-    
-    
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
+        # Skip entirely when this sensor's status did not change in this update
+        if self.object_id not in self._coordinator.changed_keys:
+            return
+
         # find the correct device and status corresponding to this sensor
-        (_, _, status_map) = self._coordinator.data
-        status = status_map.get(self.object_id)
+        status = self._coordinator.status_map.get(self.object_id)
+
+        # Fast path: nothing to write when the raw value is unchanged
+        if status is None or status.val == self._last_raw_val:
+            return
 
         # Update any attributes
-        if status:
-            if self._update_attributes(status, False):
-                self.async_write_ha_state()
-    
-    
-    def _update_attributes(self, status, is_create):
-        
-        # Transform values according to the metadata params for this status/sensor
-        match self._params.type:
-            case 'measure':
-                if self._params.weight and self._params.weight != 1 and self._params.weight != 0:
-                    # Convert to float
-                    attr_precision = int(math.floor(math.log10(1.0 / self._params.weight)))
-                    attr_val = round(float(status.val) * self._params.weight, attr_precision) if status.val!=None else None
-                    attr_unit = self.get_unit()
-                else:
-                    # Convert to int
-                    attr_precision = 0
-                    attr_val = int(status.val) if status.val!=None else None
-                    attr_unit = self.get_unit()
-                    
-            case 'enum':
-                # Lookup the dict string for the value and otherwise return the value itself
-                attr_precision = None
-                attr_val = self._get_string(self._params.values.get(status.val, status.val)) if status.val!=None else None
-                attr_unit = None
-
-            case 'label' | _:
-                if self._params.type != 'label':
-                    _LOGGER.warn(f"DAB Pumps encountered an unknown sensor type '{self._params.type}' for '{self._params.key}'. Please contact the integration developer to have this resolved.")
-                    
-                # Convert to string
-                attr_precision = None
-                attr_val = self._get_string(str(status.val)) if status.val!=None else None
-                attr_unit = None
-
-        # Process any changes
-        changed = False
-        
-        # update creation-time only attributes
-        if is_create:
-            _LOGGER.debug(f"Create sensor '{status.key}' ({status.unique_id})")
-            
-            self._attr_unique_id = status.unique_id
-            
-            self._attr_has_entity_name = True
-            self._attr_name = self._get_string(status.key)
-            self._name = status.key
-            
-            self._attr_state_class = self.get_sensor_state_class()
-            self._attr_entity_category = self.get_entity_category()
-
-            self._attr_device_class = self.get_sensor_device_class() 
-            self._attr_device_info = DeviceInfo(
-               identifiers = {(DOMAIN, self._device.serial)},
-               name = self._device.name,
-               manufacturer =  self._device.vendor,
-               model = self._device.product,
-               serial_number = self._device.serial,
-               hw_version = self._device.version,
-            )
-            changed = True
-        
+        if self._update_attributes(status):
+            self._coordinator.async_schedule_write(self)
+
+
+    def _initial_attributes(self, status):
+        """Set all attributes; called exactly once from __init__"""
+        _LOGGER.debug("Create sensor '%s' (%s)", status.key, status.unique_id)
+
+        self._attr_unique_id = status.unique_id
+
+        self._attr_has_entity_name = True
+        self._attr_name = self._get_string(status.key)
+        self._name = status.key
+
+        self._attr_state_class = self.get_sensor_state_class()
+        self._is_total = self._attr_state_class in TOTAL_STATE_CLASSES
+        self._attr_entity_category = self.get_entity_category()
+
+        # The icon only depends on the unit, which is fixed per sensor
+        self._attr_icon = self.get_icon()
+
+        self._attr_device_class = self.get_sensor_device_class() 
+        self._attr_device_info = DeviceInfo(
+           identifiers = {(DOMAIN, self._device.serial)},
+           name = self._device.name,
+           manufacturer =  self._device.vendor,
+           model = self._device.product,
+           serial_number = self._device.serial,
+           hw_version = self._device.version,
+        )
+
+        # Set the initial value
+        self._last_raw_val = status.val
+        (attr_val, attr_unit, attr_precision) = self._compute(status.val)
+
+        self._attr_native_value = attr_val
+        self._attr_native_unit_of_measurement = attr_unit
+        self._attr_suggested_display_precision = attr_precision
+
+
+    def _update_attributes(self, status):
+        """Update the value attributes; returns whether anything changed"""
+
+        # Skip the whole transform below when the raw value has not changed since last update
+        if status.val == self._last_raw_val:
+            return False
+        self._last_raw_val = status.val
+
+        # Transform the value according to the metadata params for this status/sensor.
+        # Unit, precision and icon are constant per sensor and were already set at creation.
+        (attr_val, _, _) = self._compute(status.val)
+
         # additional check for TOTAL and TOTAL_INCREASING values:
         # ignore decreases that are not significant (less than 50% change)
-        if self._attr_state_class in [SensorStateClass.TOTAL, SensorStateClass.TOTAL_INCREASING] and \
+        if self._is_total and \
            self._attr_native_value is not None and \
            attr_val is not None and \
            attr_val < self._attr_native_value and \
            not check_percentage_change(self._attr_native_value, attr_val, 50):
             
-            _LOGGER.debug(f"Ignore non-significant decrease in sensor '{status.key}' ({status.unique_id}) from {self._attr_native_value} to {attr_val}")
+            _LOGGER.debug("Ignore non-significant decrease in sensor '%s' (%s) from %s to %s", status.key, status.unique_id, self._attr_native_value, attr_val)
             attr_val = self._attr_native_value
 
         # update value if it has changed
-        if is_create or self._attr_native_value != attr_val:
+        if self._attr_native_value != attr_val:
             self._attr_native_value = attr_val
-            self._attr_native_unit_of_measurement = attr_unit
-            self._attr_suggested_display_precision = attr_precision
-            
-            self._attr_icon = self.get_icon()
-            changed = True
-        
-        return changed
-    
+            return True
+
+        return False
+
+
+    def _compute_measure_float(self, val):
+        """Transform a raw measure value with a non-unity weight into (value, unit, precision)"""
+        attr_val = round(float(val) * self._params.weight, self._precision) if val!=None else None
+        return (attr_val, self._attr_unit, self._precision)
+
+
+    def _compute_measure_int(self, val):
+        """Transform a raw measure value with unity weight into (value, unit, precision)"""
+        attr_val = int(val) if val!=None else None
+        return (attr_val, self._attr_unit, self._precision)
+
+
+    def _compute_enum(self, val):
+        """Lookup the translated string for the value and otherwise return the value itself"""
+        attr_val = self._enum_lookup.get(val, val) if val!=None else None
+        return (attr_val, None, None)
+
+
+    def _compute_label(self, val):
+        """Transform a raw label value into a translated string"""
+        attr_val = self._get_string(str(val)) if val!=None else None
+        return (attr_val, None, None)
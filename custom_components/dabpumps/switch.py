@@ -1,37 +1,16 @@
-import asyncio
 import logging
-import math
 
-from homeassistant import config_entries
-from homeassistant import exceptions
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.components.switch import ENTITY_ID_FORMAT
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.core import callback
-from homeassistant.exceptions import HomeAssistantError
-from homeassistant.exceptions import IntegrationError
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity_registry import async_get
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from homeassistant.const import (
-    STATE_ON,
-    STATE_OFF,
-)
-
-from datetime import timedelta
-from datetime import datetime
-
-from collections import defaultdict
-from collections import namedtuple
-
 
 from .const import (
     DOMAIN,
@@ -53,6 +32,10 @@ from .entity_base import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map a (translated) status value directly onto the is_on attribute;
+# values that are neither ON nor OFF map to None via .get()
+SWITCH_STATE_MAP = {v: True for v in SWITCH_VALUES_ON} | {v: False for v in SWITCH_VALUES_OFF}
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     """
@@ -69,10 +52,10 @@ class DabPumpsSwitch(CoordinatorEntity, SwitchEntity, DabPumpsEntity):
     Could be a configuration setting that is part of a pump like ESybox, Esybox.mini
     Or could be part of a communication module like DConnect Box/Box2
     """
-    
+
     def __init__(self, coordinator, install_id, object_id, device, params, status) -> None:
         """ Initialize the sensor. """
-        CoordinatorEntity.__init__(self, coordinator)
+        CoordinatorEntity.__init__(self, coordinator, context=object_id)
         DabPumpsEntity.__init__(self, coordinator, params)
         
         # The unique identifier for this sensor within Home Assistant
@@ -84,7 +67,19 @@ class DabPumpsSwitch(CoordinatorEntity, SwitchEntity, DabPumpsEntity):
         self._device = device
         self._params = params
         self._key = params.key
-        self._dict = { k: self._get_string(v) for k,v in params.values.items() }
+        self._last_raw_val = None
+        self._dict = self._get_values_lookup()
+
+        # Resolve the raw values to send for ON and OFF once; the mapping is
+        # fixed, so the toggle handlers need no per-call scan
+        self._data_val_on = next((k for k,v in self._dict.items() if k in SWITCH_VALUES_ON or v in SWITCH_VALUES_ON), None)
+        self._data_val_off = next((k for k,v in self._dict.items() if k in SWITCH_VALUES_OFF or v in SWITCH_VALUES_OFF), None)
+
+        # Map each raw status value straight onto is_on. Raw values that are
+        # not in params.values fall back to their own ON/OFF interpretation,
+        # matching the old two-step lookup.
+        self._val_to_state = dict(SWITCH_STATE_MAP)
+        self._val_to_state.update({ k: SWITCH_STATE_MAP.get(v) for k,v in params.values.items() })
 
         # Create all attributes
         self._update_attributes(status, True)
@@ -96,30 +91,24 @@ class DabPumpsSwitch(CoordinatorEntity, SwitchEntity, DabPumpsEntity):
         return self.object_id
     
     
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for use in home assistant."""
-        return self._attr_unique_id
-    
-    
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self._attr_name
-        
-        
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         
+        # Skip entirely when this switch's status did not change in this update
+        if self.object_id not in self._coordinator.changed_keys:
+            return
+
         # find the correct device and status corresponding to this sensor
-        (_, _, status_map) = self._coordinator.data
-        status = status_map.get(self.object_id)
+        status = self._coordinator.status_map.get(self.object_id)
+
+        # Fast path: nothing to do when the raw value is unchanged
+        if status is None or status.val == self._last_raw_val:
+            return
 
         # Update any attributes
-        if status:
-            if self._update_attributes(status, False):
-                self.async_write_ha_state()
+        if self._update_attributes(status, False):
+            self._coordinator.async_schedule_write(self)
     
     
     def _update_attributes(self, status, is_create):
@@ -128,18 +117,8 @@ class DabPumpsSwitch(CoordinatorEntity, SwitchEntity, DabPumpsEntity):
             _LOGGER.error(f"Unexpected parameter type ({self._params.type}) for a select entity")
 
         # Process any changes
-        changed = False
-        val = self._params.values.get(status.val, status.val)
-        if val in SWITCH_VALUES_ON:
-            attr_is_on = True
-            attr_state = STATE_ON
-            
-        elif val in SWITCH_VALUES_OFF:
-            attr_is_on = False
-            attr_state = STATE_OFF
-        else:
-            attr_is_on = None
-            attr_state = None
+        self._last_raw_val = status.val
+        attr_is_on = self._val_to_state.get(status.val)
         
         # update creation-time only attributes
         if is_create:
@@ -154,6 +133,10 @@ class DabPumpsSwitch(CoordinatorEntity, SwitchEntity, DabPumpsEntity):
             self._attr_entity_category = self.get_entity_category()
             self._attr_device_class = SwitchDeviceClass.SWITCH
 
+            # Unit and icon are fixed by the params; set them once
+            self._attr_unit_of_measurement = self.get_unit()
+            self._attr_icon = self.get_icon()
+
             self._attr_device_info = DeviceInfo(
                identifiers = {(DOMAIN, self._device.serial)},
                name = self._device.name,
@@ -162,42 +145,41 @@ class DabPumpsSwitch(CoordinatorEntity, SwitchEntity, DabPumpsEntity):
                serial_number = self._device.serial,
                hw_version = self._device.version,
             )
-            changed = True
-        
-        # update value if it has changed
-        if is_create or self._attr_is_on != attr_is_on:
             self._attr_is_on = attr_is_on
-            self._attr_state = attr_state
-            self._attr_unit_of_measurement = self.get_unit()
-            
-            self._attr_icon = self.get_icon()
-            changed = True
-            
-        return changed
+            return True
+        
+        # steady state: only the on/off value can still change
+        if self._attr_is_on == attr_is_on:
+            return False
+
+        self._attr_is_on = attr_is_on
+        return True
     
     
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""
-        data_val = next((k for k,v in self._dict.items() if k in SWITCH_VALUES_ON or v in SWITCH_VALUES_ON), None)
+        data_val = self._data_val_on
         if data_val:
             _LOGGER.info(f"Set {self.entity_id} to ON ({data_val})")
             
             success = await self._coordinator.async_modify_data(self.object_id, data_val)
             if success:
+                # Track the optimistically written value, so the next poll
+                # still flips us back if the remote write did not take effect
+                self._last_raw_val = data_val
                 self._attr_is_on = True
-                self._attr_state = STATE_ON
                 self.async_write_ha_state()
     
     
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the entity off."""
-        data_val = next((k for k,v in self._dict.items() if k in SWITCH_VALUES_OFF or v in SWITCH_VALUES_OFF), None)
+        data_val = self._data_val_off
         if data_val:
             _LOGGER.info(f"Set {self.entity_id} to OFF ({data_val})")
             
             success = await self._coordinator.async_modify_data(self.object_id, data_val)
             if success:
+                self._last_raw_val = data_val
                 self._attr_is_on = False
-                self._attr_state = STATE_OFF
                 self.async_write_ha_state()
     